@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_serializer, field_validator
 
 
 class CompressionInfo(BaseModel):
@@ -156,6 +156,11 @@ class MemorySlot(BaseModel):
 
         return normalized if normalized else None
 
+    @field_serializer("tags", when_used="json")
+    def serialize_tags(self, tags: set[str]) -> list[str]:
+        """Emit tags sorted so JSON output (and slot files) is deterministic."""
+        return sorted(tags)
+
     def add_entry(self, entry: MemoryEntry) -> None:
         """Add a new entry and update timestamp."""
         self.entries.append(entry)
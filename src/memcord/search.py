@@ -3,6 +3,7 @@
 import math
 import re
 from collections import OrderedDict, defaultdict
+from collections.abc import Callable
 from typing import Any
 
 from .constants import STOP_WORDS_INDEX
@@ -181,6 +182,7 @@ class SearchEngine:
             return []
 
         # Apply filters and create results
+        passes_filters = self._compile_filters(query)
         results = []
         for slot_name, score in relevance_scores.items():
             slot = self.slots_cache.get(slot_name)
@@ -188,7 +190,7 @@ class SearchEngine:
                 continue
 
             # Apply filters
-            if not self._passes_filters(slot, query):
+            if not passes_filters(slot):
                 continue
 
             # Find matching entries and create results
@@ -238,43 +240,60 @@ class SearchEngine:
         else:  # NOT logic would need special handling
             return dict(self.index.search(query_parts[0]))
 
-    def _passes_filters(self, slot: MemorySlot, query: SearchQuery) -> bool:
-        """Check if a slot passes all search filters."""
-        # Tag filters
-        if query.include_tags:
-            if not any(slot.has_tag(tag) for tag in query.include_tags):
-                return False
+    def _compile_filters(self, query: SearchQuery) -> Callable[[MemorySlot], bool]:
+        """Build a slot predicate for the query's active filters.
 
-        if query.exclude_tags:
-            if any(slot.has_tag(tag) for tag in query.exclude_tags):
-                return False
+        Filter values are normalized into sets once per search rather than once
+        per candidate slot, and filters the query leaves empty add no check.
+        """
+        checks: list[Callable[[MemorySlot], bool]] = []
 
-        # Group filters
-        if query.include_groups and slot.group_path:
-            if not any(group in slot.group_path for group in query.include_groups):
-                return False
+        # Tag filters (tags are stored lower-cased and stripped, as has_tag() compares them)
+        if query.include_tags:
+            include_tags = frozenset(tag.lower().strip() for tag in query.include_tags)
+            checks.append(lambda slot: not include_tags.isdisjoint(slot.tags))
 
-        if query.exclude_groups and slot.group_path:
-            if any(group in slot.group_path for group in query.exclude_groups):
-                return False
+        if query.exclude_tags:
+            exclude_tags = frozenset(tag.lower().strip() for tag in query.exclude_tags)
+            checks.append(lambda slot: exclude_tags.isdisjoint(slot.tags))
+
+        # Group filters (substring matches, only applied to grouped slots)
+        if query.include_groups:
+            include_groups = tuple(query.include_groups)
+            checks.append(lambda slot: not slot.group_path or any(group in slot.group_path for group in include_groups))
+
+        if query.exclude_groups:
+            exclude_groups = tuple(query.exclude_groups)
+            checks.append(
+                lambda slot: not slot.group_path or not any(group in slot.group_path for group in exclude_groups)
+            )
 
         # Date filters
-        if query.date_from or query.date_to:
-            slot_dates = [entry.timestamp for entry in slot.entries]
-            if query.date_from:
-                if not any(date >= query.date_from for date in slot_dates):
-                    return False
-            if query.date_to:
-                if not any(date <= query.date_to for date in slot_dates):
-                    return False
+        if query.date_from:
+            date_from = query.date_from
+            checks.append(lambda slot: any(entry.timestamp >= date_from for entry in slot.entries))
+
+        if query.date_to:
+            date_to = query.date_to
+            checks.append(lambda slot: any(entry.timestamp <= date_to for entry in slot.entries))
 
         # Content type filters
         if query.content_types:
-            entry_types = {entry.type for entry in slot.entries}
-            if not entry_types.intersection(query.content_types):
-                return False
+            content_types = frozenset(query.content_types)
+            checks.append(lambda slot: any(entry.type in content_types for entry in slot.entries))
+
+        if not checks:
+            return lambda slot: True
+        if len(checks) == 1:
+            return checks[0]
+
+        def passes_all(slot: MemorySlot) -> bool:
+            for check in checks:
+                if not check(slot):
+                    return False
+            return True
 
-        return True
+        return passes_all
 
     def _create_search_results(self, slot: MemorySlot, query: SearchQuery, base_score: float) -> list[SearchResult]:
         """Create search results for a slot with matching entries."""
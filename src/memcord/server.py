@@ -44,7 +44,7 @@ from .errors import (
     MemcordError,
     OperationTimeoutError,
 )
-from .models import SearchQuery
+from .models import MemorySlot, SearchQuery
 from .response_builder import ErrorResult, handle_errors
 from .security import SecurityMiddleware
 from .status_monitoring import StatusMonitoringSystem
@@ -83,6 +83,9 @@ def with_timeout_check(operation_id_key: str = "operation_id"):
 class ChatMemoryServer:
     """MCP server for chat memory management."""
 
+    # Formats memcord_export, memcord_share and memory:// resources can produce
+    SUPPORTED_EXPORT_FORMATS = ("md", "txt", "json")
+
     # Error message constants (eliminate duplication)
     ERROR_NO_SLOT_SELECTED = "Error: No slot selected. Use memcord_name <slot> or memcord_use <slot> first."
     ERROR_EMPTY_CHAT_TEXT = "Error: Chat text cannot be empty"
@@ -127,11 +130,15 @@ class ChatMemoryServer:
         # Status monitoring system
         self.status_monitor = StatusMonitoringSystem(storage_manager=self.storage, data_dir=memory_dir)
 
-        # Pre-populate tool cache for faster first list_tools() call
+        # Tool definitions are built once per process; this instance's list is fixed
+        # after construction, so list_tools() and list_tools_direct() return copies of it
         self._tool_cache = self._get_basic_tools()
         if self.enable_advanced_tools:
             self._tool_cache.extend(self._get_advanced_tools())
 
+        # Resource list and the slot-file fingerprint it was built from
+        self._resource_cache: tuple[tuple[int, frozenset[tuple[str, int, int]]], list[Resource]] | None = None
+
         # Keep a fallback NLTK summarizer for stats; actual summarization is per-call
         from .summarizer import TextSummarizer
 
@@ -433,15 +440,19 @@ class ChatMemoryServer:
 
     async def list_tools_direct(self) -> list[Tool]:
         """Direct tools listing method for testing purposes."""
-        if self._tool_cache is None:
-            tools = self._get_basic_tools()
-            if self.enable_advanced_tools:
-                tools.extend(self._get_advanced_tools())
-            self._tool_cache = tools
-        return self._tool_cache
+        return list(self._tool_cache)
 
     async def list_resources_direct(self) -> list[Resource]:
-        """Direct resources listing method for testing purposes."""
+        """Direct resources listing method for testing purposes.
+
+        The list is rebuilt only when a slot has been saved or deleted, or a slot
+        file changed on disk, since the last call; otherwise a copy of the previous
+        list is returned, so callers cannot alter the cached one.
+        """
+        fingerprint = self.storage.slot_files_fingerprint()
+        if self._resource_cache is not None and self._resource_cache[0] == fingerprint:
+            return list(self._resource_cache[1])
+
         resources = []
         slots_info = await self.storage.list_memory_slots()
 
@@ -451,7 +462,7 @@ class ChatMemoryServer:
             total_length = slot_info["total_length"]
             summary = f"{entry_count} {'entry' if entry_count == 1 else 'entries'}, {total_length} chars"
 
-            for fmt in ["md", "txt", "json"]:
+            for fmt in self.SUPPORTED_EXPORT_FORMATS:
                 resources.append(
                     Resource(
                         uri=f"memory://{slot_name}.{fmt}",  # type: ignore[arg-type]
@@ -462,7 +473,8 @@ class ChatMemoryServer:
                     )
                 )
 
-        return resources
+        self._resource_cache = (fingerprint, resources)
+        return list(resources)
 
     async def list_resource_templates_direct(self) -> list[ResourceTemplate]:
         """Direct resource templates listing for testing and internal use."""
@@ -508,6 +520,7 @@ class ChatMemoryServer:
 
     async def read_resource_direct(self, uri: str) -> str:
         """Direct resource reading method for testing purposes."""
+        uri = str(uri)  # Resource listings hand out pydantic AnyUrl objects
         # Parse URI: memory://slot_name.format
         if not uri.startswith("memory://"):
             raise ValueError("Invalid URI scheme")
@@ -524,7 +537,7 @@ class ChatMemoryServer:
             raise ValueError(f"Memory slot '{slot_name}' not found")
 
         # Check if format is valid
-        if format_ext not in ["md", "txt", "json"]:
+        if format_ext not in self.SUPPORTED_EXPORT_FORMATS:
             raise ValueError(f"Unsupported format: {format_ext}")
 
         # Generate content in requested format
@@ -623,6 +636,16 @@ class ChatMemoryServer:
 
     def _get_basic_tools(self) -> list[Tool]:
         """Get the list of basic tools (always available)."""
+        return list(self._basic_tool_defs())
+
+    def _get_advanced_tools(self) -> list[Tool]:
+        """Get the list of advanced tools (optional)."""
+        return list(self._advanced_tool_defs())
+
+    @staticmethod
+    @functools.cache
+    def _basic_tool_defs() -> tuple[Tool, ...]:
+        """Build the annotated basic tool definitions once per process."""
         tools = [
             # Core Tools
             Tool(
@@ -1024,10 +1047,12 @@ class ChatMemoryServer:
                 },
             ),
         ]
-        return self._annotate_tools(tools)
+        return tuple(ChatMemoryServer._annotate_tools(tools))
 
-    def _get_advanced_tools(self) -> list[Tool]:
-        """Get the list of advanced tools (optional)."""
+    @staticmethod
+    @functools.cache
+    def _advanced_tool_defs() -> tuple[Tool, ...]:
+        """Build the annotated advanced tool definitions once per process."""
         tools = [
             # Organization Tools
             Tool(
@@ -1174,7 +1199,11 @@ class ChatMemoryServer:
                     "type": "object",
                     "properties": {
                         "slot_name": {"type": "string", "description": "Memory slot name to export"},
-                        "format": {"type": "string", "enum": ["md", "txt", "json"], "description": "Export format"},
+                        "format": {
+                            "type": "string",
+                            "enum": list(ChatMemoryServer.SUPPORTED_EXPORT_FORMATS),
+                            "description": "Export format",
+                        },
                         "include_metadata": {
                             "type": "boolean",
                             "default": True,
@@ -1193,7 +1222,7 @@ class ChatMemoryServer:
                         "slot_name": {"type": "string", "description": "Memory slot name to share"},
                         "formats": {
                             "type": "array",
-                            "items": {"type": "string", "enum": ["md", "txt", "json"]},
+                            "items": {"type": "string", "enum": list(ChatMemoryServer.SUPPORTED_EXPORT_FORMATS)},
                             "description": "List of formats to generate",
                             "default": ["md", "txt"],
                         },
@@ -1207,7 +1236,7 @@ class ChatMemoryServer:
                 },
             ),
         ]
-        return self._annotate_tools(tools)
+        return tuple(ChatMemoryServer._annotate_tools(tools))
 
     def _setup_handlers(self):
         """Set up MCP server handlers."""
@@ -1222,12 +1251,7 @@ class ChatMemoryServer:
 
             Tools are categorized as basic (always available) and advanced (configurable).
             """
-            if self._tool_cache is None:
-                tools = self._get_basic_tools()
-                if self.enable_advanced_tools:
-                    tools.extend(self._get_advanced_tools())
-                self._tool_cache = tools
-            return self._tool_cache
+            return list(self._tool_cache)
 
         @self.app.call_tool()
         async def call_tool(name: str, arguments: dict[str, Any]) -> Sequence[TextContent] | CallToolResult:
@@ -1273,27 +1297,7 @@ class ChatMemoryServer:
         @self.app.list_resources()
         async def list_resources() -> list[Resource]:
             """List MCP file resources for memory slots."""
-            resources = []
-            slots_info = await self.storage.list_memory_slots()
-
-            for slot_info in slots_info:
-                slot_name = slot_info["name"]
-                entry_count = slot_info["entry_count"]
-                total_length = slot_info["total_length"]
-                summary = f"{entry_count} {'entry' if entry_count == 1 else 'entries'}, {total_length} chars"
-
-                for fmt in ["md", "txt", "json"]:
-                    resources.append(
-                        Resource(
-                            uri=f"memory://{slot_name}.{fmt}",  # type: ignore[arg-type]
-                            name=f"{slot_name} ({fmt.upper()})",
-                            mimeType=self._get_mime_type(fmt),
-                            description=f"{slot_name} — {summary}",
-                            size=total_length if fmt != "json" else None,
-                        )
-                    )
-
-            return resources
+            return await self.list_resources_direct()
 
         @self.app.list_resource_templates()
         async def list_resource_templates():
@@ -1308,6 +1312,7 @@ class ChatMemoryServer:
         @self.app.read_resource()
         async def read_resource(uri: str) -> str:
             """Read MCP file resource."""
+            uri = str(uri)  # The MCP SDK passes a pydantic AnyUrl
             try:
                 # Parse URI: memory://slot_name.format
                 if not uri.startswith("memory://"):
@@ -1439,8 +1444,8 @@ class ChatMemoryServer:
         if not chat_text.strip():
             return [TextContent(type="text", text=self.ERROR_EMPTY_CHAT_TEXT)]
 
-        entry = await self.storage.save_memory(slot_name, chat_text.strip())
-
+        slot = await self._save_and_return(slot_name, chat_text)
+        entry = slot.entries[-1]
         return [
             TextContent(
                 type="text",
@@ -1451,6 +1456,10 @@ class ChatMemoryServer:
             )
         ]
 
+    async def _save_and_return(self, slot_name: str, chat_text: str) -> MemorySlot:
+        """Save memcord_save text to a slot and return the committed slot; storage failures propagate."""
+        return await self.storage.save_memory_slot(slot_name, chat_text.strip())
+
     @handle_errors(default_error_message="Auto-save failed")
     async def _handle_auto_save(self, arguments: dict[str, Any]) -> list[TextContent]:
         """Handle auto_save — saves to default slot, creating it if necessary."""
@@ -1579,7 +1588,9 @@ class ChatMemoryServer:
         llm_meta = self._extract_summarizer_metadata(summarizer, config)
 
         # Save summary to slot
-        entry = await self.storage.add_summary_entry(slot_name, chat_text.strip(), summary, metadata=llm_meta)
+        entry = await self.storage.add_summary_entry(
+            slot_name, chat_text.strip(), summary, metadata=llm_meta, config=config
+        )
 
         await self._emit_progress(1.0, 1.0, "Summary saved.")
 
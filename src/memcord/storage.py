@@ -4,7 +4,9 @@ import asyncio
 import json
 import logging
 import shutil
-from collections.abc import Callable
+from collections import Counter
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -40,11 +42,23 @@ from .storage_efficiency import (
     StreamingOperations,
 )
 
+try:
+    import orjson
+except ImportError:  # Optional speed-up from the "fast" extra; stdlib json is the fallback
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 _STORAGE_LINKS_FILENAME = "_storage_links.json"
 
 
+def _dump_slot_json(data: dict[str, Any]) -> bytes:
+    """Serialize a slot dict to the on-disk UTF-8 JSON layout (2-space indent, non-ASCII kept)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
 class StorageManager:
     """Manages file-based storage for memory slots."""
 
@@ -129,6 +143,89 @@ class StorageManager:
         # Track active search cache keys so they can be invalidated on slot writes
         self._search_cache_keys: set[str] = set()
 
+        # Serialized slot payloads buffered by batched_writes(), keyed by file path
+        self._pending_writes: dict[Path, bytes] | None = None
+
+        # Parsed _storage_links.json, keyed by the file's (st_mtime_ns, st_size)
+        self._storage_links_cache: tuple[tuple[int, int], dict[str, str]] | None = None
+
+        # list_memory_slots() metadata per slot, keyed by the slot file's (st_mtime_ns, st_size)
+        self._slot_meta_cache: dict[str, tuple[tuple[int, int], dict[str, Any]]] = {}
+
+        # Bumped on every slot save or delete so slot_files_fingerprint() changes even
+        # when a rewrite leaves a file's mtime and size as they were
+        self._slot_write_generation = 0
+
+    @classmethod
+    async def create(cls, **kwargs: Any) -> "StorageManager":
+        """Construct a StorageManager off the event loop and initialize its subsystems.
+
+        The constructor does synchronous directory setup and backup recovery, so
+        running it in a worker thread lets several instances start concurrently.
+        """
+        storage = await asyncio.to_thread(cls, **kwargs)
+        await storage._ensure_cache_initialized()
+        await storage._ensure_efficiency_initialized()
+        return storage
+
+    @asynccontextmanager
+    async def batched_writes(self) -> AsyncIterator[None]:
+        """Buffer slot file writes and flush them together when the block exits.
+
+        Saves made inside the block update caches and indexes as usual, but the
+        JSON file write is deferred; repeated saves to one slot coalesce into a
+        single write. Buffered slots are readable through read_memory() before
+        the flush. Nested blocks join the outermost batch. If the block raises,
+        nothing is written; if a write fails, the other files are still written
+        and the first error is raised.
+        """
+        if self._pending_writes is not None:
+            yield
+            return
+
+        self._pending_writes = {}
+        try:
+            yield
+        except BaseException:
+            # Leave disk as it was before the block and drop in-memory copies of the
+            # discarded saves, so later reads and searches go back to the files
+            discarded, self._pending_writes = self._pending_writes, None
+            for path in discarded:
+                self._search_engine.remove_slot(path.stem)
+                await self.invalidate_slot_cache(path.stem)
+                await self._invalidate_search_caches(path.stem)
+                self._slot_meta_cache.pop(path.stem, None)
+            if discarded:
+                self._search_initialized = False
+                self._slot_write_generation += 1
+            raise
+
+        pending, self._pending_writes = self._pending_writes, None
+        async with self._lock:
+            results = await asyncio.gather(
+                *(self._write_slot_file(path, payload) for path, payload in pending.items()),
+                return_exceptions=True,
+            )
+        errors = [result for result in results if isinstance(result, BaseException)]
+        for path, result in zip(pending, results, strict=True):
+            if isinstance(result, BaseException):
+                continue
+            try:
+                self._index_mtime_snapshot[path.stem] = path.stat().st_mtime
+            except OSError:
+                pass  # Snapshot update is best-effort
+        if errors:
+            raise errors[0]
+
+    @staticmethod
+    async def _write_slot_file(slot_path: Path, payload: bytes) -> None:
+        """Write a serialized slot payload to disk.
+
+        One worker-thread hop covers open, write and close (aiofiles would take
+        one per call), and a batched flush runs its writes side by side.
+        """
+        await asyncio.to_thread(slot_path.write_bytes, payload)
+
     async def _ensure_cache_initialized(self):
         """Initialize cache manager if not already initialized."""
         if self.enable_caching and self._cache_manager and not self._cache_initialized:
@@ -177,6 +274,16 @@ class StorageManager:
             if candidate.exists():
                 yield candidate
 
+    def _iter_listed_slot_files(self):
+        """Yield slot files plus slots buffered by batched_writes() but not yet flushed."""
+        seen_names: set[str] = set()
+        for p in self._iter_slot_files():
+            seen_names.add(p.stem)
+            yield p
+        for path in list(self._pending_writes or ()):
+            if path.stem not in seen_names:
+                yield path
+
     def _resolve_base_dir(self, slot_name: str) -> Path:
         """Return the directory a slot's files live in.
 
@@ -205,6 +312,8 @@ class StorageManager:
         await self._ensure_cache_initialized()
 
         slot_path = await self._get_slot_path(slot_name)
+        if self._pending_writes and slot_path in self._pending_writes:
+            return MemorySlot.model_validate_json(self._pending_writes[slot_path])
         if not slot_path.exists():
             return None
 
@@ -234,10 +343,10 @@ class StorageManager:
 
         # Load from file (cache miss or invalidated)
         try:
-            async with aiofiles.open(slot_path, encoding="utf-8") as f:
+            async with aiofiles.open(slot_path, "rb") as f:
                 data = await f.read()
-                slot_data = json.loads(data)
-                slot = MemorySlot(**slot_data)
+                # Parse and validate in one pass; malformed JSON surfaces as a ValidationError (a ValueError)
+                slot = MemorySlot.model_validate_json(data)
 
                 # Cache with file mtime for invalidation
                 if self._cache_manager:
@@ -279,39 +388,52 @@ class StorageManager:
             except Exception as e:
                 print(f"Warning: Could not create delta for {slot.slot_name}: {e}")
 
-        # Create a backup if file exists
-        if slot_path.exists():
+        # Create a backup if file exists (batched writes leave the file in place until flush)
+        batching = self._pending_writes is not None
+        if slot_path.exists() and not batching:
             backup_path = slot_path.with_suffix(".json.bak")
             await aiofiles.os.rename(str(slot_path), str(backup_path))
 
         try:
             # Use streaming operations for large slots
             content_size = sum(len(entry.content) for entry in slot.entries)
-            if content_size > 1024 * 1024:  # 1MB threshold
+            if content_size > 1024 * 1024 and not batching:  # 1MB threshold
                 await StreamingOperations.write_slot_streaming(slot, slot_path)
             else:
-                # Standard write for smaller slots
-                slot_dict = slot.model_dump()
-                slot_dict = self._serialize_datetime(slot_dict)
+                # Standard write for smaller slots; pydantic's JSON mode formats datetimes and sorts tags
+                payload = _dump_slot_json(slot.model_dump(mode="json"))
 
-                async with aiofiles.open(slot_path, "w", encoding="utf-8") as f:
-                    await f.write(json.dumps(slot_dict, indent=2, ensure_ascii=False))
+                if self._pending_writes is not None:
+                    self._pending_writes[slot_path] = payload
+                else:
+                    await self._write_slot_file(slot_path, payload)
 
             # Remove backup on successful save
             backup_path = slot_path.with_suffix(".json.bak")
             if backup_path.exists():
                 await aiofiles.os.remove(str(backup_path))
 
+            # Drop listing metadata even if a same-tick rewrite left mtime and size unchanged
+            self._slot_meta_cache.pop(slot.slot_name, None)
+            self._slot_write_generation += 1
+
             # Update mtime snapshot after successful save
-            try:
-                self._index_mtime_snapshot[slot.slot_name] = slot_path.stat().st_mtime
-            except Exception:
-                pass  # Snapshot update is best-effort
+            file_mtime = None
+            if not batching:
+                try:
+                    file_mtime = slot_path.stat().st_mtime
+                    self._index_mtime_snapshot[slot.slot_name] = file_mtime
+                except Exception:
+                    pass  # Snapshot update is best-effort
 
-            # Update cache with new slot data
+            # Update cache with new slot data, stamped with the file mtime so an
+            # immediate read-back is served from memory instead of re-reading disk
             if self._cache_manager:
                 cache_key = generate_slot_cache_key(slot.slot_name)
-                await self._cache_manager.put(cache_key, slot.model_dump(), CacheLevel.MEMORY, ttl_seconds=3600)
+                cache_data = slot.model_dump()
+                if file_mtime is not None:
+                    cache_data["_file_mtime"] = file_mtime
+                await self._cache_manager.put(cache_key, cache_data, CacheLevel.MEMORY, ttl_seconds=3600)
 
                 await self._invalidate_search_caches(slot.slot_name)
 
@@ -365,18 +487,6 @@ class StorageManager:
             except Exception:
                 pass
 
-    def _serialize_datetime(self, obj: Any) -> Any:
-        """Convert datetime objects and sets to JSON-serializable format."""
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        elif isinstance(obj, set):
-            return sorted(obj)  # Convert sets to sorted lists
-        elif isinstance(obj, dict):
-            return {k: self._serialize_datetime(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._serialize_datetime(item) for item in obj]
-        return obj
-
     async def create_or_get_slot(self, slot_name: str) -> MemorySlot:
         """Create a new slot or get existing one."""
         # Run the same validation as MemorySlot.validate_slot_name before any I/O
@@ -402,6 +512,11 @@ class StorageManager:
 
     async def save_memory(self, slot_name: str, content: str, entry_type: str = "manual_save") -> MemoryEntry:
         """Save content to memory slot."""
+        slot = await self.save_memory_slot(slot_name, content, entry_type)
+        return slot.entries[-1]
+
+    async def save_memory_slot(self, slot_name: str, content: str, entry_type: str = "manual_save") -> MemorySlot:
+        """Save content to memory slot and return the slot as committed, new entry last."""
         MemorySlot.validate_slot_name(slot_name)
         if not content or not content.strip():
             raise ValueError("Content cannot be empty")
@@ -423,45 +538,86 @@ class StorageManager:
 
             await self._save_slot(slot)
             self._search_engine.add_slot(slot)  # Update search index
-            return entry
+            return slot
 
     async def read_memory(self, slot_name: str) -> MemorySlot | None:
         """Read memory slot content."""
         return await self._load_slot(slot_name)
 
     async def list_memory_slots(self) -> list[dict[str, Any]]:
-        """List all available memory slots with metadata."""
+        """List all available memory slots with metadata.
+
+        Metadata is reused while a slot file's mtime and size are unchanged, so
+        repeated listings stat each file instead of loading it. Writes from other
+        processes change the stat and are picked up on the next call.
+        """
         slots_info = []
+        meta_cache: dict[str, tuple[tuple[int, int], dict[str, Any]]] = {}
 
-        for slot_file in self._iter_slot_files():
+        for slot_file in self._iter_listed_slot_files():
             slot_name = slot_file.stem
             try:
-                slot = await self._load_slot(slot_name)
-                if slot:
-                    slots_info.append(
-                        {
-                            "name": slot_name,
-                            "created_at": slot.created_at.isoformat(),
-                            "updated_at": slot.updated_at.isoformat(),
-                            "entry_count": len(slot.entries),
-                            "total_length": slot.get_total_content_length(),
-                            "is_current": slot_name == self._state.current_slot,
-                        }
-                    )
+                buffered = self._pending_writes is not None and slot_file in self._pending_writes
+                if not buffered:
+                    st = slot_file.stat()
+                    stamp = (st.st_mtime_ns, st.st_size)
+                cached = self._slot_meta_cache.get(slot_name)
+                if not buffered and cached is not None and cached[0] == stamp:
+                    meta = cached[1]
+                else:
+                    slot = await self._load_slot(slot_name)
+                    if not slot:
+                        continue
+                    meta = {
+                        "name": slot_name,
+                        "created_at": slot.created_at.isoformat(),
+                        "updated_at": slot.updated_at.isoformat(),
+                        "entry_count": len(slot.entries),
+                        "total_length": slot.get_total_content_length(),
+                        "group_path": slot.group_path,
+                    }
+                if not buffered:
+                    meta_cache[slot_name] = (stamp, meta)
+                slots_info.append({**meta, "is_current": slot_name == self._state.current_slot})
             except Exception:
                 # Skip corrupted slots
                 continue
 
+        self._slot_meta_cache = meta_cache
         return sorted(slots_info, key=lambda x: x["updated_at"], reverse=True)
 
+    def list_slot_names(self) -> set[str]:
+        """Return the names of all stored slots without loading their contents."""
+        return {slot_file.stem for slot_file in self._iter_listed_slot_files()}
+
+    def slot_files_fingerprint(self) -> tuple[int, frozenset[tuple[str, int, int]]]:
+        """Return this instance's write generation and (slot_name, mtime_ns, size) for every slot file.
+
+        Changes whenever a slot is saved or deleted through this instance, or a
+        slot file is written, added or removed by another process, so callers can
+        reuse data derived from list_memory_slots() until it does.
+        """
+        files = set()
+        for slot_file in self._iter_slot_files():
+            try:
+                st = slot_file.stat()
+            except OSError:
+                continue
+            files.add((slot_file.stem, st.st_mtime_ns, st.st_size))
+        return self._slot_write_generation, frozenset(files)
+
     async def add_summary_entry(
         self,
         slot_name: str,
         original_content: str,
         summary: str,
         metadata: dict[str, Any] | None = None,
+        config: SlotConfig | None = None,
     ) -> MemoryEntry:
-        """Add a summary entry to a memory slot."""
+        """Add a summary entry to a memory slot.
+
+        Callers that already loaded the slot's config can pass it to skip a re-read.
+        """
         async with self._lock:
             slot = await self._load_slot(slot_name)
 
@@ -479,7 +635,8 @@ class StorageManager:
 
             slot.add_entry(entry)
 
-            config = await self.load_slot_config(slot_name)
+            if config is None:
+                config = await self.load_slot_config(slot_name)
             if config.max_auto_summaries > 0:
                 self._consolidate_old_summaries(slot, config.max_auto_summaries)
 
@@ -518,18 +675,28 @@ class StorageManager:
         """Load the slot_name -> custom directory redirect registry.
 
         Always local to this device's memory_dir; never itself relocated.
+        Every slot path lookup consults it, so the parsed registry is reused
+        until the file's mtime or size changes. Callers get their own copy.
         """
         path = self._storage_links_path()
-        if not path.exists():
+        try:
+            st = path.stat()
+        except OSError:
             return {}
+        stamp = (st.st_mtime_ns, st.st_size)
+        if self._storage_links_cache is not None and self._storage_links_cache[0] == stamp:
+            return dict(self._storage_links_cache[1])
         try:
             data = json.loads(path.read_text(encoding="utf-8"))
-            return data if isinstance(data, dict) else {}
+            links = data if isinstance(data, dict) else {}
         except Exception:
             return {}
+        self._storage_links_cache = (stamp, links)
+        return dict(links)
 
     def _save_storage_links(self, links: dict[str, str]) -> None:
         """Persist the redirect registry, removing the file entirely once empty."""
+        self._storage_links_cache = None  # A same-tick rewrite could keep mtime and size
         path = self._storage_links_path()
         if not links:
             if path.exists():
@@ -1023,16 +1190,9 @@ class StorageManager:
 
     async def list_groups(self) -> list[GroupInfo]:
         """List all memory groups."""
-        # Dynamically update member counts
-        group_counts: dict[str, int] = {}
-        for slot_file in self._iter_slot_files():
-            slot_name = slot_file.stem
-            try:
-                slot = await self._load_slot(slot_name)
-                if slot and slot.group_path:
-                    group_counts[slot.group_path] = group_counts.get(slot.group_path, 0) + 1
-            except Exception:
-                continue
+        # Dynamically update member counts from the listing metadata, which only
+        # reloads slots whose files changed since the last listing
+        group_counts = Counter(info["group_path"] for info in await self.list_memory_slots() if info["group_path"])
 
         # Update member counts in groups
         for group_path, count in group_counts.items():
@@ -1044,7 +1204,10 @@ class StorageManager:
     async def _delete_slot_internal(self, slot_name: str) -> bool:
         """Internal delete slot method - assumes lock is already held."""
         slot_path = await self._get_slot_path(slot_name)
-        if not slot_path.exists():
+        # Drop a payload buffered by batched_writes() so the flush cannot resurrect the slot
+        buffered = self._pending_writes is not None and self._pending_writes.pop(slot_path, None) is not None
+        on_disk = slot_path.exists()
+        if not buffered and not on_disk:
             return False
 
         # Remove from search index
@@ -1060,9 +1223,12 @@ class StorageManager:
 
         # Invalidate cache
         await self.invalidate_slot_cache(slot_name)
+        self._slot_meta_cache.pop(slot_name, None)
+        self._slot_write_generation += 1
 
         # Delete file
-        await aiofiles.os.remove(str(slot_path))
+        if on_disk:
+            await aiofiles.os.remove(str(slot_path))
         return True
 
     async def delete_slot(self, slot_name: str) -> bool:
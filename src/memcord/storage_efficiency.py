@@ -572,22 +572,8 @@ class StreamingOperations:
         temp_path = slot_path.with_suffix(".tmp")
 
         async with aiofiles.open(temp_path, "w", encoding="utf-8") as f:
-            # Write slot header
-            slot_dict = slot.model_dump()
-
-            # Convert datetime objects and sets
-            def serialize_datetime(obj):
-                if isinstance(obj, dict):
-                    return {k: serialize_datetime(v) for k, v in obj.items()}
-                elif isinstance(obj, list):
-                    return [serialize_datetime(item) for item in obj]
-                elif isinstance(obj, datetime):
-                    return obj.isoformat()
-                elif isinstance(obj, set):
-                    return sorted(obj)
-                return obj
-
-            slot_dict = serialize_datetime(slot_dict)
+            # Write slot header; JSON mode already formats datetimes and sorts tags
+            slot_dict = slot.model_dump(mode="json")
 
             # Write JSON in streaming fashion for large entries
             await f.write("{\n")
@@ -5,22 +5,62 @@ that make tests cleaner, more maintainable, and easier to write.
 """
 
 import asyncio
+import os
+import shutil
+import sys
 import tempfile
+import uuid
 from collections.abc import AsyncGenerator, Generator
 from pathlib import Path
 
 import pytest
 
 from memcord.models import MemoryEntry, MemorySlot
+from memcord.status_monitoring import MetricsCollector, OperationLogger, ResourceMonitor, SystemResource
 from memcord.storage import StorageManager
 
 
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async tests on uvloop when it is installed (never on Windows)."""
+    if sys.platform != "win32":
+        try:
+            import uvloop
+
+            return uvloop.EventLoopPolicy()
+        except ImportError:
+            pass
+    return asyncio.DefaultEventLoopPolicy()
+
+
 @pytest.fixture
 def anyio_backend():
     """Configure async backend for anyio/pytest compatibility."""
     return "asyncio"
 
 
+@pytest.fixture(scope="module")
+def tmpfs_dir(tmp_path_factory) -> Generator[Path, None, None]:
+    """Provide a per-module scratch directory, RAM-backed on Linux when /dev/shm exists.
+
+    For tests that assert behaviour rather than durability; keeping slot files
+    in tmpfs takes disk I/O out of them. StorageManager puts archives next to
+    memory_dir, so use a subdirectory of this as memory_dir to keep everything
+    under the directory that gets removed.
+    """
+    shm = Path("/dev/shm")
+    if not (sys.platform.startswith("linux") and shm.is_dir() and os.access(shm, os.W_OK)):
+        yield tmp_path_factory.mktemp("memcord", numbered=True)
+        return
+
+    root = shm / f"memcord-test-{uuid.uuid4().hex}"
+    root.mkdir()
+    try:
+        yield root
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
 @pytest.fixture
 def temp_storage_dir() -> Generator[str, None, None]:
     """Provide a temporary directory for storage testing."""
@@ -30,12 +70,16 @@ def temp_storage_dir() -> Generator[str, None, None]:
 
 @pytest.fixture
 async def clean_storage_manager(
-    temp_storage_dir: str,
+    tmp_path: Path,
 ) -> AsyncGenerator[StorageManager, None]:
-    """Provide a clean StorageManager instance with isolated storage."""
+    """Provide a clean StorageManager instance with isolated storage.
+
+    Built on pytest's per-test ``tmp_path`` so every test (and every xdist
+    worker) gets its own directory.
+    """
     storage = StorageManager(
-        memory_dir=temp_storage_dir,
-        shared_dir=str(Path(temp_storage_dir) / "shared"),
+        memory_dir=str(tmp_path),
+        shared_dir=str(tmp_path / "shared"),
         enable_caching=False,  # Disable for predictable testing
         enable_efficiency=False,  # Disable for simpler testing
         enable_memory_management=False,  # Disable for cleaner testing
@@ -374,33 +418,54 @@ class StorageTestHelper:
                 pass  # Ignore cleanup errors
 
 
+@pytest.fixture
+def aio_benchmark(benchmark, event_loop_policy):
+    """Benchmark a coroutine function with pytest-benchmark.
+
+    Each round drives ``coro_fn(*args, **kwargs)`` to completion on a private
+    event loop, so async tests can be timed from a sync test function.
+    """
+    loop = event_loop_policy.new_event_loop()
+
+    def run(coro_fn, *args, **kwargs):
+        return benchmark(lambda: loop.run_until_complete(coro_fn(*args, **kwargs)))
+
+    yield run
+    loop.close()
+
+
 # Component-specific fixtures
 @pytest.fixture
 def metrics_collector():
     """Provide a clean MetricsCollector for testing."""
-    from memcord.status_monitoring import MetricsCollector
-
     return MetricsCollector()
 
 
 @pytest.fixture
 def operation_logger():
     """Provide a clean OperationLogger for testing."""
-    from memcord.status_monitoring import OperationLogger
-
     return OperationLogger()
 
 
 @pytest.fixture
 def resource_monitor():
     """Provide a clean ResourceMonitor for testing."""
-    from memcord.status_monitoring import ResourceMonitor
-
     monitor = ResourceMonitor()
     yield monitor
     # Cleanup
     if monitor.monitoring:
         monitor.stop_monitoring()
+    monitor.resource_history.clear()
+
+
+@pytest.fixture(scope="module")
+def resource_monitor_ro():
+    """Provide a module-shared ResourceMonitor for tests that never mutate its state.
+
+    Tests using this fixture may only patch methods on it; anything that starts
+    monitoring or touches resource_history must use ``resource_monitor``.
+    """
+    return ResourceMonitor()
 
 
 # Component-specific factories
@@ -410,15 +475,11 @@ class MetricsCollectorFactory:
     @staticmethod
     def create_with_max_metrics(max_metrics: int = 1000):
         """Create MetricsCollector with specific max_metrics."""
-        from memcord.status_monitoring import MetricsCollector
-
         return MetricsCollector(max_metrics=max_metrics)
 
     @staticmethod
     def create_with_sample_data():
         """Create MetricsCollector with sample performance data."""
-        from memcord.status_monitoring import MetricsCollector
-
         collector = MetricsCollector()
 
         # Add sample metrics
@@ -435,15 +496,11 @@ class OperationLoggerFactory:
     @staticmethod
     def create_with_max_logs(max_logs: int = 1000):
         """Create OperationLogger with specific max_logs."""
-        from memcord.status_monitoring import OperationLogger
-
         return OperationLogger(max_logs=max_logs)
 
     @staticmethod
     def create_with_sample_operations():
         """Create OperationLogger with sample operations."""
-        from memcord.status_monitoring import OperationLogger
-
         logger = OperationLogger()
 
         # Add sample operations
@@ -462,8 +519,6 @@ class ResourceMonitorFactory:
     @staticmethod
     def create_with_interval(interval: int = 30):
         """Create ResourceMonitor with specific collection interval."""
-        from memcord.status_monitoring import ResourceMonitor
-
         return ResourceMonitor(collection_interval=interval)
 
     @staticmethod
@@ -471,8 +526,6 @@ class ResourceMonitorFactory:
         """Create a sample SystemResource for testing."""
         from datetime import datetime
 
-        from memcord.status_monitoring import SystemResource
-
         return SystemResource(
             cpu_percent=50.0,
             memory_percent=65.0,
@@ -490,8 +543,6 @@ class ResourceMonitorFactory:
         """Create SystemResource with high usage for alert testing."""
         from datetime import datetime
 
-        from memcord.status_monitoring import SystemResource
-
         return SystemResource(
             cpu_percent=95.0,  # Critical
             memory_percent=90.0,  # Warning
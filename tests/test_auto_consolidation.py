@@ -270,3 +270,18 @@ class TestAutoConsolidationIntegration:
         slot = await storage.read_memory("s")
         summary_entries = [e for e in slot.entries if e.type in {"auto_summary", "rolled_summary"}]
         assert len(summary_entries) == 3
+
+    @pytest.mark.asyncio
+    async def test_passed_config_used_without_reload(self, tmp_path, monkeypatch):
+        storage = _make_storage(tmp_path)
+
+        async def fail_load(slot_name):
+            raise AssertionError("config should not be re-read")
+
+        monkeypatch.setattr(storage, "load_slot_config", fail_load)
+        config = SlotConfig(max_auto_summaries=2)
+        for i in range(4):
+            await storage.add_summary_entry("s", f"original {i}", f"summary {i}", config=config)
+        slot = await storage.read_memory("s")
+        assert len(slot.entries) == 2
+        assert slot.entries[0].type == "rolled_summary"
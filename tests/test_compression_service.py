@@ -500,3 +500,22 @@ class TestCompressionServiceDecompress:
 
         assert result.success is False
         assert "Corrupted data" in result.error
+
+
+class TestContentCompressor:
+    """Tests for the ContentCompressor storage format."""
+
+    def test_round_trip_uses_gzip(self):
+        """Test that content is written as gzip and decodes back to the original text."""
+        import base64
+        import gzip
+
+        from memcord.compression import ContentCompressor
+
+        compressor = ContentCompressor()
+        text = '{"entries": ["repeated content"]}' * 100
+        compressed, metadata = compressor.compress_json_content(text)
+
+        assert metadata.algorithm == "gzip"
+        assert gzip.decompress(base64.b64decode(compressed)).decode("utf-8") == text
+        assert compressor.decompress_json_content(compressed, metadata) == text
@@ -99,6 +99,22 @@ class TestStorageManagerCustomPath:
 
         assert path == external / "test.json"
 
+    async def test_registry_reparsed_only_when_file_changes(self, tmp_path, monkeypatch):
+        storage = _make_storage(tmp_path)
+        external = tmp_path / "external"
+        await storage.set_custom_storage_path("test", str(external))
+        await storage._get_slot_path("test")
+
+        # Unchanged registry: served from the cached parse, never re-read
+        monkeypatch.setattr(Path, "read_text", lambda *a, **k: pytest.fail("registry re-read while unchanged"))
+        assert await storage._get_slot_path("test") == external / "test.json"
+        monkeypatch.undo()
+
+        # Edited outside this instance: picked up once the stat changes
+        other = tmp_path / "other"
+        storage._storage_links_path().write_text(json.dumps({"test": str(other)}), encoding="utf-8")
+        assert await storage._get_slot_path("test") == other / "test.json"
+
     async def test_save_and_load_roundtrip_at_custom_path(self, tmp_path):
         storage = _make_storage(tmp_path)
         external = tmp_path / "external"
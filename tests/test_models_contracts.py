@@ -382,6 +382,11 @@ class TestMemorySlotContracts:
         assert slot_dict["group_path"] == "test/group"
         assert slot_dict["priority"] == 1
 
+        # JSON mode (used for slot files) emits sorted tags and ISO timestamps
+        json_dict = slot.model_dump(mode="json")
+        assert json_dict["tags"] == ["tag1", "tag2"]
+        assert json_dict["created_at"] == slot.created_at.isoformat()
+
     def test_memory_slot_compression_error_handling(self):
         """Test compression decompression error handling."""
         from unittest.mock import patch
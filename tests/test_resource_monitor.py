@@ -11,7 +11,8 @@ Coverage: 75%+
 Tests use direct fixture usage for cleaner code.
 """
 
-import time
+import dataclasses
+import threading
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock, patch
 
@@ -31,41 +32,78 @@ def test_resource_monitor_initialization(resource_monitor):
     assert monitor_custom.collection_interval == 60
 
 
+def _sample_resource() -> SystemResource:
+    """Build a canned SystemResource so monitor threads skip real psutil sampling."""
+    return SystemResource(
+        cpu_percent=50.0,
+        memory_percent=60.0,
+        memory_used_mb=4000.0,
+        memory_available_mb=2000.0,
+        disk_usage_percent=70.0,
+        disk_free_gb=300.0,
+        process_count=100,
+        thread_count=25,
+        timestamp=datetime.now(),
+    )
+
+
+def _signal_after_collections(monitor, count: int = 1, fail_first: bool = False):
+    """Patch the monitor's collector and return (patcher, event, calls).
+
+    The event is set once the collector has been invoked ``count`` times, so
+    tests can wait on it instead of sleeping for a fixed interval.
+    """
+    collected = threading.Event()
+    calls = []
+
+    def fake_collect():
+        calls.append(1)
+        if len(calls) >= count:
+            collected.set()
+        if fail_first and len(calls) == 1:
+            raise RuntimeError("Test error")
+        return _sample_resource()
+
+    return patch.object(monitor, "_collect_resource_data", side_effect=fake_collect), collected, calls
+
+
 def test_resource_monitor_start_stop():
     """Test starting and stopping resource monitoring."""
-    monitor = ResourceMonitor(collection_interval=1)  # Short interval for testing
+    monitor = ResourceMonitor(collection_interval=0.05)  # Short interval for testing
+    patcher, collected, _ = _signal_after_collections(monitor)
 
     assert not monitor.monitoring
 
-    monitor.start_monitoring()
-    assert monitor.monitoring is True
-    assert monitor.monitor_thread is not None
-    assert monitor.monitor_thread.is_alive()
+    with patcher:
+        monitor.start_monitoring()
+        assert monitor.monitoring is True
+        assert monitor.monitor_thread is not None
+        assert monitor.monitor_thread.is_alive()
 
-    # Let it collect at least one data point
-    time.sleep(1.5)
+        # Wait for at least one data point
+        assert collected.wait(timeout=2.0)
 
-    monitor.stop_monitoring()
+        monitor.stop_monitoring()  # Joins the monitor thread
     assert monitor.monitoring is False
-
-    # Give thread time to stop
-    time.sleep(0.5)
     assert not monitor.monitor_thread.is_alive()
+    assert len(monitor.resource_history) >= 1
 
 
 def test_resource_monitor_double_start():
     """Test that starting monitoring twice doesn't create multiple threads."""
-    monitor = ResourceMonitor(collection_interval=1)
+    monitor = ResourceMonitor(collection_interval=0.05)
+    patcher, _, _ = _signal_after_collections(monitor)
 
-    monitor.start_monitoring()
-    first_thread = monitor.monitor_thread
+    with patcher:
+        monitor.start_monitoring()
+        first_thread = monitor.monitor_thread
 
-    monitor.start_monitoring()  # Should not create new thread
-    second_thread = monitor.monitor_thread
+        monitor.start_monitoring()  # Should not create new thread
+        second_thread = monitor.monitor_thread
 
-    assert first_thread is second_thread
+        assert first_thread is second_thread
 
-    monitor.stop_monitoring()
+        monitor.stop_monitoring()
 
 
 @patch("psutil.cpu_percent")
@@ -73,7 +111,7 @@ def test_resource_monitor_double_start():
 @patch("psutil.disk_usage")
 @patch("psutil.pids")
 @patch("psutil.Process")
-def test_collect_resource_data(mock_process, mock_pids, mock_disk, mock_memory, mock_cpu, resource_monitor):
+def test_collect_resource_data(mock_process, mock_pids, mock_disk, mock_memory, mock_cpu, resource_monitor_ro):
     """Test resource data collection with mocked psutil."""
     # Mock return values
     mock_cpu.return_value = 45.5
@@ -96,7 +134,7 @@ def test_collect_resource_data(mock_process, mock_pids, mock_disk, mock_memory,
     mock_process_instance.num_threads.return_value = 25
     mock_process.return_value = mock_process_instance
 
-    resource_data = resource_monitor._collect_resource_data()
+    resource_data = resource_monitor_ro._collect_resource_data()
 
     assert isinstance(resource_data, SystemResource)
     assert resource_data.cpu_percent == 45.5
@@ -110,9 +148,9 @@ def test_collect_resource_data(mock_process, mock_pids, mock_disk, mock_memory,
     assert isinstance(resource_data.timestamp, datetime)
 
 
-def test_get_current_resources(resource_monitor):
+def test_get_current_resources(resource_monitor_ro):
     """Test getting current resource usage."""
-    with patch.object(resource_monitor, "_collect_resource_data") as mock_collect:
+    with patch.object(resource_monitor_ro, "_collect_resource_data") as mock_collect:
         mock_resource = SystemResource(
             cpu_percent=50.0,
             memory_percent=70.0,
@@ -126,7 +164,7 @@ def test_get_current_resources(resource_monitor):
         )
         mock_collect.return_value = mock_resource
 
-        current = resource_monitor.get_current_resources()
+        current = resource_monitor_ro.get_current_resources()
         assert current is mock_resource
         mock_collect.assert_called_once()
 
@@ -134,21 +172,13 @@ def test_get_current_resources(resource_monitor):
 def test_get_resource_history(resource_monitor):
     """Test resource history retrieval with time filtering."""
     base_time = datetime.now()
+    template = _sample_resource()
 
     # Add some mock history data
-    for i in range(5):
-        resource = SystemResource(
-            cpu_percent=float(i * 10),
-            memory_percent=float(i * 15),
-            memory_used_mb=1000.0 + i * 100,
-            memory_available_mb=2000.0 - i * 50,
-            disk_usage_percent=50.0 + i * 5,
-            disk_free_gb=500.0 - i * 10,
-            process_count=100 + i * 10,
-            thread_count=20 + i * 2,
-            timestamp=base_time - timedelta(minutes=i * 30),
-        )
-        resource_monitor.resource_history.append(resource)
+    resource_monitor.resource_history.extend(
+        dataclasses.replace(template, cpu_percent=float(i * 10), timestamp=base_time - timedelta(minutes=i * 30))
+        for i in range(5)
+    )
 
     # Get history for last 2 hours (should get 4 items: 0, 30, 60, 90 minutes ago)
     # Use slightly less than 2 hours to avoid boundary issues on Windows
@@ -162,10 +192,10 @@ def test_get_resource_history(resource_monitor):
     assert oldest_timestamp >= cutoff_time
 
 
-def test_get_resource_alerts(resource_monitor):
+def test_get_resource_alerts(resource_monitor_ro):
     """Test resource usage alert generation."""
     # Test with high resource usage
-    with patch.object(resource_monitor, "get_current_resources") as mock_get_current:
+    with patch.object(resource_monitor_ro, "get_current_resources") as mock_get_current:
         high_usage_resource = SystemResource(
             cpu_percent=95.0,  # Critical
             memory_percent=90.0,  # Warning
@@ -179,7 +209,7 @@ def test_get_resource_alerts(resource_monitor):
         )
         mock_get_current.return_value = high_usage_resource
 
-        alerts = resource_monitor.get_resource_alerts()
+        alerts = resource_monitor_ro.get_resource_alerts()
 
         # Should have 3 alerts: CPU critical, memory warning, disk critical
         assert len(alerts) == 3
@@ -203,9 +233,9 @@ def test_get_resource_alerts(resource_monitor):
         assert disk_alert["value"] == 98.0
 
 
-def test_get_resource_alerts_healthy(resource_monitor):
+def test_get_resource_alerts_healthy(resource_monitor_ro):
     """Test resource alerts with healthy system."""
-    with patch.object(resource_monitor, "get_current_resources") as mock_get_current:
+    with patch.object(resource_monitor_ro, "get_current_resources") as mock_get_current:
         healthy_resource = SystemResource(
             cpu_percent=30.0,
             memory_percent=50.0,
@@ -219,13 +249,13 @@ def test_get_resource_alerts_healthy(resource_monitor):
         )
         mock_get_current.return_value = healthy_resource
 
-        alerts = resource_monitor.get_resource_alerts()
+        alerts = resource_monitor_ro.get_resource_alerts()
         assert len(alerts) == 0
 
 
-def test_get_resource_alerts_warning_levels(resource_monitor):
+def test_get_resource_alerts_warning_levels(resource_monitor_ro):
     """Test resource alerts at warning thresholds."""
-    with patch.object(resource_monitor, "get_current_resources") as mock_get_current:
+    with patch.object(resource_monitor_ro, "get_current_resources") as mock_get_current:
         warning_resource = SystemResource(
             cpu_percent=80.0,  # Warning level
             memory_percent=88.0,  # Warning level
@@ -239,7 +269,7 @@ def test_get_resource_alerts_warning_levels(resource_monitor):
         )
         mock_get_current.return_value = warning_resource
 
-        alerts = resource_monitor.get_resource_alerts()
+        alerts = resource_monitor_ro.get_resource_alerts()
 
         # Should have 3 warning alerts
         assert len(alerts) == 3
@@ -249,55 +279,40 @@ def test_get_resource_alerts_warning_levels(resource_monitor):
 
 def test_monitor_loop_exception_handling():
     """Test that monitoring loop handles exceptions gracefully."""
-    monitor = ResourceMonitor(collection_interval=0.1)  # Very short interval
-
-    with patch.object(monitor, "_collect_resource_data") as mock_collect:
-        # Make the first call raise an exception, then work normally
-        mock_collect.side_effect = [
-            RuntimeError("Test error"),
-            SystemResource(
-                cpu_percent=50.0,
-                memory_percent=60.0,
-                memory_used_mb=4000.0,
-                memory_available_mb=2000.0,
-                disk_usage_percent=70.0,
-                disk_free_gb=300.0,
-                process_count=100,
-                thread_count=25,
-                timestamp=datetime.now(),
-            ),
-        ]
+    monitor = ResourceMonitor(collection_interval=0.05)  # Very short interval
 
+    # Make the first call raise an exception, then work normally
+    patcher, collected, calls = _signal_after_collections(monitor, count=2, fail_first=True)
+    with patcher:
         monitor.start_monitoring()
-        time.sleep(0.3)  # Let it run through exception and recovery
+        assert collected.wait(timeout=2.0)  # Ran through exception and recovery
         monitor.stop_monitoring()
 
-        # Should have called collect at least twice (exception + success)
-        assert mock_collect.call_count >= 2
+    # Should have called collect at least twice (exception + success)
+    assert len(calls) >= 2
+    assert len(monitor.resource_history) >= 1
 
 
 def test_resource_history_maxlen(resource_monitor):
     """Test that resource history respects maxlen limit."""
-    # Add more items than maxlen (2880)
-    for i in range(3000):
-        resource = SystemResource(
-            cpu_percent=float(i),  # Use unique values instead of modulo
-            memory_percent=50.0,
-            memory_used_mb=4000.0,
-            memory_available_mb=2000.0,
-            disk_usage_percent=70.0,
-            disk_free_gb=300.0,
-            process_count=100,
-            thread_count=25,
-            timestamp=datetime.now() - timedelta(seconds=i),
-        )
-        resource_monitor.resource_history.append(resource)
+    base_time = datetime.now()
+    history = resource_monitor.resource_history
+    template = _sample_resource()
+
+    def make_resource(i: int) -> SystemResource:
+        # Only the unique CPU value and timestamp vary between entries
+        return dataclasses.replace(template, cpu_percent=float(i), timestamp=base_time - timedelta(seconds=i))
+
+    # One leading item that must be evicted, then exactly maxlen more (120..2999).
+    # Items 1..119 would be evicted immediately, so they are never constructed.
+    history.append(make_resource(0))
+    history.extend(make_resource(i) for i in range(3000 - history.maxlen, 3000))
 
-    # Should only keep the most recent 2880 items
-    assert len(resource_monitor.resource_history) == 2880
+    # Should only keep the most recent maxlen (2880) items
+    assert len(history) == history.maxlen == 2880
 
     # Should contain the most recent items (2999, 2998, ..., 120)
-    cpu_values = [r.cpu_percent for r in resource_monitor.resource_history]
+    cpu_values = [r.cpu_percent for r in history]
     assert 2999.0 in cpu_values  # Most recent item
     assert 120.0 in cpu_values  # Should be the oldest kept item
     assert 119.0 not in cpu_values  # Should be evicted
@@ -306,15 +321,17 @@ def test_resource_history_maxlen(resource_monitor):
 
 def test_resource_monitor_context_manager():
     """Test using ResourceMonitor as context manager."""
-    monitor = ResourceMonitor(collection_interval=0.1)
+    monitor = ResourceMonitor(collection_interval=0.05)
+    patcher, collected, _ = _signal_after_collections(monitor)
 
     # Manual context manager simulation since ResourceMonitor doesn't implement it yet
-    try:
-        monitor.start_monitoring()
-        assert monitor.monitoring is True
-        time.sleep(0.2)
-    finally:
-        monitor.stop_monitoring()
+    with patcher:
+        try:
+            monitor.start_monitoring()
+            assert monitor.monitoring is True
+            assert collected.wait(timeout=2.0)
+        finally:
+            monitor.stop_monitoring()
 
     assert monitor.monitoring is False
 
@@ -10,7 +10,10 @@ Fix: Track file modification times and re-index when stale detected.
 """
 
 import asyncio
-import tempfile
+import os
+import shutil
+import time
+import uuid
 from pathlib import Path
 
 import pytest
@@ -19,153 +22,222 @@ from memcord.models import SearchQuery
 from memcord.storage import StorageManager
 
 
-class TestSearchIndexStaleness:
-    """Test suite for search index staleness bug."""
+def bump_mtime(path: Path, bump_s: int = 2) -> None:
+    """Advance a file's mtime explicitly instead of sleeping until the clock moves.
 
-    @pytest.fixture
-    def temp_dir(self):
-        """Provide temporary directory for testing."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield tmpdir
+    Filesystems with coarse (even whole-second) mtime resolution make short
+    sleeps unreliable; the staleness check only needs to observe a newer mtime.
+    """
+    ns = time.time_ns() + bump_s * 1_000_000_000
+    os.utime(path, ns=(ns, ns))
 
-    @pytest.mark.asyncio
-    async def test_same_instance_search_finds_recent_save(self, temp_dir):
-        """Test that search finds content in the same MCP instance.
 
-        This should PASS even with the bug, as the in-memory index is updated.
-        """
-        storage = StorageManager(
-            memory_dir=temp_dir,
-            shared_dir=str(Path(temp_dir) / "shared"),
-            enable_caching=False,
-            enable_efficiency=False,
-            enable_memory_management=False,
-        )
+@pytest.fixture
+def memory_dir(tmpfs_dir):
+    """Provide a per-test memory directory inside the module's tmpfs directory.
 
-        # Save content
-        await storage.save_memory("test-slot", "CI/CD fixes for memcord")
+    These tests only need mtime/exists semantics, not durability.
+    """
+    root = tmpfs_dir / uuid.uuid4().hex
+    path = root / "memory"
+    path.mkdir(parents=True)
+    try:
+        yield path
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
 
-        # Search immediately in same instance
-        results = await storage.search_memory(SearchQuery(query="CI/CD"))
 
-        # Should find the content
-        assert len(results) > 0, "Same-instance search should find recently saved content"
-        assert any("test-slot" in r.slot_name for r in results)
+@pytest.fixture
+def shared_dir(memory_dir):
+    """Provide the pre-created shared directory path as a string."""
+    path = memory_dir / "shared"
+    path.mkdir(exist_ok=True)
+    return str(path)
 
-    @pytest.mark.asyncio
-    async def test_cross_instance_search_finds_recent_save(self, temp_dir):
-        """Test that search finds content from a different MCP instance.
 
-        This FAILS with the bug: Second instance gets stale index from disk.
-        This is the critical bug we're fixing.
-        """
-        # Instance A: Save content
-        storage_a = StorageManager(
-            memory_dir=temp_dir,
-            shared_dir=str(Path(temp_dir) / "shared"),
-            enable_caching=False,
-            enable_efficiency=False,
-            enable_memory_management=False,
-        )
-        await storage_a.save_memory("test-slot", "CI/CD fixes for memcord")
-
-        # Instance B: New MCP instance (simulates new conversation)
-        storage_b = StorageManager(
-            memory_dir=temp_dir,
-            shared_dir=str(Path(temp_dir) / "shared"),
-            enable_caching=False,
-            enable_efficiency=False,
-            enable_memory_management=False,
-        )
+@pytest.fixture
+def storage_kwargs(memory_dir, shared_dir):
+    """Provide the StorageManager arguments shared by every instance in a test."""
+    return {
+        "memory_dir": str(memory_dir),
+        "shared_dir": shared_dir,
+        "enable_caching": False,
+        "enable_efficiency": False,
+        "enable_memory_management": False,
+    }
 
-        # Search in instance B
-        results = await storage_b.search_memory(SearchQuery(query="CI/CD"))
 
-        # Should find content saved by instance A
-        assert len(results) > 0, "Cross-instance search should find content from other instance"
-        assert any("test-slot" in r.slot_name for r in results), "Should find 'test-slot' saved by instance A"
+@pytest.fixture
+def make_storage(storage_kwargs):
+    """Return a factory for StorageManagers sharing the test's temp directory."""
 
-    @pytest.mark.asyncio
-    async def test_search_after_external_modification(self, temp_dir):
-        """Test that search detects when files are modified externally.
+    def _make_storage() -> StorageManager:
+        return StorageManager(**storage_kwargs)
 
-        Scenario: Instance A initializes index, then Instance B saves content.
-        Instance A should detect the change and re-index.
-        """
-        # Instance A: Initialize by searching
-        storage_a = StorageManager(
-            memory_dir=temp_dir,
-            shared_dir=str(Path(temp_dir) / "shared"),
-            enable_caching=False,
-            enable_efficiency=False,
-            enable_memory_management=False,
-        )
-        await storage_a.save_memory("initial-slot", "Initial content")
-        await storage_a.search_memory(SearchQuery(query="initial"))
-        # Now instance A has initialized index
-
-        # Instance B: Save new content (external modification from A's perspective)
-        storage_b = StorageManager(
-            memory_dir=temp_dir,
-            shared_dir=str(Path(temp_dir) / "shared"),
-            enable_caching=False,
-            enable_efficiency=False,
-            enable_memory_management=False,
-        )
-        await storage_b.save_memory("new-slot", "new content about CI/CD")
+    return _make_storage
 
-        # Small delay to ensure file mtime changes
-        await asyncio.sleep(0.1)
 
-        # Instance A: Search again (should detect external change)
-        results = await storage_a.search_memory(SearchQuery(query="CI/CD"))
+class StoragePool:
+    """Named StorageManager instances for one scenario, created on first use."""
 
-        # Should find the new content saved by instance B
-        assert len(results) > 0, "Should detect external modification and find new content"
-        assert any("new-slot" in r.slot_name for r in results), "Should find 'new-slot' added externally"
+    def __init__(self, storage_kwargs: dict):
+        self._storage_kwargs = storage_kwargs
+        self._instances: dict[str, StorageManager] = {}
+
+    def __call__(self, name: str) -> StorageManager:
+        if name not in self._instances:
+            self._instances[name] = StorageManager(**self._storage_kwargs)
+        return self._instances[name]
+
+    async def start(self, *names: str) -> None:
+        """Create any missing instances concurrently via StorageManager.create()."""
+        missing = [name for name in dict.fromkeys(names) if name not in self._instances]
+        created = await asyncio.gather(*(StorageManager.create(**self._storage_kwargs) for _ in missing))
+        self._instances.update(zip(missing, created, strict=True))
+
+
+def save(instance: str, slot_name: str, content: str, bump_s: int | None = None):
+    """Scenario step: save via ``instance``, optionally bumping the slot file's mtime."""
+
+    async def step(pool, memory_dir: Path) -> None:
+        await pool(instance).save_memory(slot_name, content)
+        if bump_s is not None:
+            bump_mtime(memory_dir / f"{slot_name}.json", bump_s)
+
+    return step
+
+
+def search(instance: str, query: str):
+    """Scenario step: search via ``instance`` so its index is initialized."""
+
+    async def step(pool, memory_dir: Path) -> None:
+        await pool(instance).search_memory(SearchQuery(query=query))
+
+    return step
+
+
+def force_stale(instance: str):
+    """Scenario step: drop ``instance``'s mtime snapshot so its next search re-indexes.
+
+    Targets the staleness path directly instead of relying on the filesystem's
+    timestamp resolution.
+    """
+
+    async def step(pool, memory_dir: Path) -> None:
+        pool(instance)._index_mtime_snapshot.clear()
+
+    return step
 
-    @pytest.mark.asyncio
-    async def test_search_after_multiple_external_saves(self, temp_dir):
-        """Test that search stays fresh with multiple external saves."""
-        storage_a = StorageManager(
-            memory_dir=temp_dir,
-            shared_dir=str(Path(temp_dir) / "shared"),
-            enable_caching=False,
-            enable_efficiency=False,
-            enable_memory_management=False,
-        )
 
-        # Initialize instance A's index
-        await storage_a.save_memory("slot-1", "First save")
-        await storage_a.search_memory(SearchQuery(query="first"))
-
-        # Multiple external saves (simulating other instances/sessions)
-        for i in range(3):
-            storage_temp = StorageManager(
-                memory_dir=temp_dir,
-                shared_dir=str(Path(temp_dir) / "shared"),
-                enable_caching=False,
-                enable_efficiency=False,
-                enable_memory_management=False,
+def concurrent_saves(*saves: tuple[str, str, str]):
+    """Scenario step: run several (instance, slot_name, content) saves concurrently, then bump their mtimes."""
+
+    async def step(pool, memory_dir: Path) -> None:
+        await pool.start(*(instance for instance, _, _ in saves))
+        await asyncio.gather(
+            *(pool(instance).save_memory(slot_name, content) for instance, slot_name, content in saves)
+        )
+        for i, (_, slot_name, _) in enumerate(saves):
+            bump_mtime(memory_dir / f"{slot_name}.json", bump_s=i + 2)
+
+    return step
+
+
+# Each scenario: steps to run, the instance that performs the final search,
+# the query, the slots it must find, and the minimum number of hits.
+STALENESS_SCENARIOS = [
+    # Same MCP instance: passes even with the bug, as the in-memory index is updated.
+    pytest.param(
+        [save("a", "test-slot", "CI/CD fixes for memcord")],
+        "a",
+        "CI/CD",
+        {"test-slot"},
+        1,
+        id="same_instance",
+    ),
+    # A new MCP instance (new conversation) must not get a stale index from disk.
+    # This is the critical bug being fixed.
+    pytest.param(
+        [save("a", "test-slot", "CI/CD fixes for memcord")],
+        "b",
+        "CI/CD",
+        {"test-slot"},
+        1,
+        id="cross_instance",
+    ),
+    # Instance A initializes its index, then instance B saves content.
+    # Instance A should re-index once its snapshot is stale. The scenarios below
+    # still rely on real file mtimes to exercise the detector end to end.
+    pytest.param(
+        [
+            save("a", "initial-slot", "Initial content"),
+            search("a", "initial"),
+            save("b", "new-slot", "new content about CI/CD"),
+            force_stale("a"),
+        ],
+        "a",
+        "CI/CD",
+        {"new-slot"},
+        1,
+        id="external_modification",
+    ),
+    # Search stays fresh across several external saves. They all go through one
+    # external instance: from A's perspective only the files on disk and their
+    # mtimes matter, not how many writers produced them.
+    pytest.param(
+        [
+            save("a", "slot-1", "First save"),
+            search("a", "first"),
+            *(save("ext", f"external-{i}", f"External content {i}", bump_s=i + 2) for i in range(3)),
+        ],
+        "a",
+        "external",
+        {"external-0", "external-1", "external-2"},
+        3,
+        id="multiple_external_saves",
+    ),
+    # Concurrent saves from multiple instances are all visible to a new instance.
+    pytest.param(
+        [
+            concurrent_saves(
+                ("a", "slot-a", "Content A about CI/CD"),
+                ("b", "slot-b", "Content B about CI/CD"),
+                ("c", "slot-c", "Content C about CI/CD"),
             )
-            await storage_temp.save_memory(f"external-{i}", f"External content {i}")
-            await asyncio.sleep(0.1)  # Ensure mtime changes
+        ],
+        "search",
+        "CI/CD",
+        {"slot-a", "slot-b", "slot-c"},
+        3,
+        id="concurrent_saves_from_multiple_instances",
+    ),
+]
+
+
+class TestSearchIndexStaleness:
+    """Test suite for search index staleness bug."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("steps", "searcher", "query", "expected_slots", "min_hits"), STALENESS_SCENARIOS)
+    async def test_search_finds_saved_content(
+        self, memory_dir, storage_kwargs, steps, searcher, query, expected_slots, min_hits
+    ):
+        """Test that search finds content saved by this or any other MCP instance."""
+        pool = StoragePool(storage_kwargs)
+
+        for step in steps:
+            await step(pool, memory_dir)
 
-        # Instance A: Search should find all external saves
-        results = await storage_a.search_memory(SearchQuery(query="external"))
+        results = await pool(searcher).search_memory(SearchQuery(query=query))
 
-        assert len(results) >= 3, f"Should find all 3 external saves, found {len(results)}"
+        assert len(results) >= min_hits, f"Expected at least {min_hits} results, found {len(results)}"
+        slot_names = {r.slot_name for r in results}
+        assert expected_slots <= slot_names, f"Missing slots: {expected_slots - slot_names}"
 
     @pytest.mark.asyncio
-    async def test_search_with_no_modifications_uses_cache(self, temp_dir):
+    async def test_search_with_no_modifications_uses_cache(self, make_storage):
         """Test that search doesn't re-index unnecessarily when nothing changed."""
-        storage = StorageManager(
-            memory_dir=temp_dir,
-            shared_dir=str(Path(temp_dir) / "shared"),
-            enable_caching=False,
-            enable_efficiency=False,
-            enable_memory_management=False,
-        )
+        storage = make_storage()
 
         await storage.save_memory("test-slot", "Test content")
 
@@ -181,42 +253,40 @@ class TestSearchIndexStaleness:
         assert len(results1) == len(results2) == len(results3)
 
     @pytest.mark.asyncio
-    async def test_save_updates_mtime_snapshot(self, temp_dir):
+    async def test_save_updates_mtime_snapshot(self, memory_dir, make_storage):
         """Test that saving updates modification time tracking.
 
         This tests the fix implementation: save operations should update
         the mtime snapshot so search doesn't incorrectly think it's stale.
         """
-        storage = StorageManager(
-            memory_dir=temp_dir,
-            shared_dir=str(Path(temp_dir) / "shared"),
-            enable_caching=False,
-            enable_efficiency=False,
-            enable_memory_management=False,
-        )
+        storage = make_storage()
+        slot_path = memory_dir / "test-slot.json"
 
         # Save and search
         await storage.save_memory("test-slot", "Content about CI/CD")
+        assert storage._index_mtime_snapshot["test-slot"] == slot_path.stat().st_mtime
         results = await storage.search_memory(SearchQuery(query="CI/CD"))
         assert len(results) > 0
 
+        # Clobber the slot's own entry so only the next save can restore it; on
+        # coarse-mtime filesystems the rewrite may keep the same timestamp
+        storage._index_mtime_snapshot["test-slot"] = -1.0
+
         # Save again (update)
         await storage.save_memory("test-slot", "Updated content about CI/CD fixes")
 
+        # The saved slot's snapshot entry matches the rewritten file
+        assert storage._index_mtime_snapshot["test-slot"] == slot_path.stat().st_mtime
+        assert not await storage._is_search_index_stale()
+
         # Search should find updated content without false-positive staleness
         results2 = await storage.search_memory(SearchQuery(query="fixes"))
         assert len(results2) > 0
 
     @pytest.mark.asyncio
-    async def test_deleted_slot_not_in_search(self, temp_dir):
+    async def test_deleted_slot_not_in_search(self, memory_dir, make_storage):
         """Test that deleted slots are removed from search index."""
-        storage = StorageManager(
-            memory_dir=temp_dir,
-            shared_dir=str(Path(temp_dir) / "shared"),
-            enable_caching=False,
-            enable_efficiency=False,
-            enable_memory_management=False,
-        )
+        storage = make_storage()
 
         # Save and verify searchable
         await storage.save_memory("temp-slot", "Temporary content")
@@ -224,12 +294,10 @@ class TestSearchIndexStaleness:
         assert len(results) > 0
 
         # Delete the slot file manually (simulating external deletion)
-        slot_path = Path(temp_dir) / "temp-slot.json"
+        slot_path = memory_dir / "temp-slot.json"
         if slot_path.exists():
             slot_path.unlink()
 
-        await asyncio.sleep(0.1)
-
         # Search should detect deletion and re-index
         # The _is_search_index_stale() should detect the missing file
         # Note: Since we're testing in same instance that did the save,
@@ -242,107 +310,69 @@ class TestSearchIndexStaleness:
         # This test mainly ensures no crash on deletion
         assert isinstance(results2, list)  # Should not crash
 
-    @pytest.mark.asyncio
-    async def test_concurrent_saves_from_multiple_instances(self, temp_dir):
-        """Test search consistency with concurrent saves from multiple instances."""
-        # Create multiple instances
-        instances = [
-            StorageManager(
-                memory_dir=temp_dir,
-                shared_dir=str(Path(temp_dir) / "shared"),
-                enable_caching=False,
-                enable_efficiency=False,
-                enable_memory_management=False,
-            )
-            for _ in range(3)
-        ]
-
-        # Concurrent saves
-        tasks = [
-            instances[0].save_memory("slot-a", "Content A about CI/CD"),
-            instances[1].save_memory("slot-b", "Content B about CI/CD"),
-            instances[2].save_memory("slot-c", "Content C about CI/CD"),
-        ]
-        await asyncio.gather(*tasks)
-
-        await asyncio.sleep(0.1)
-
-        # Search from new instance should find all
-        search_instance = StorageManager(
-            memory_dir=temp_dir,
-            shared_dir=str(Path(temp_dir) / "shared"),
-            enable_caching=False,
-            enable_efficiency=False,
-            enable_memory_management=False,
-        )
-        results = await search_instance.search_memory(SearchQuery(query="CI/CD"))
-
-        # Should find all 3 slots
-        assert len(results) >= 3, f"Should find all 3 concurrent saves, found {len(results)}"
-        slot_names = {r.slot_name for r in results}
-        assert "slot-a" in slot_names
-        assert "slot-b" in slot_names
-        assert "slot-c" in slot_names
-
 
 class TestSearchIndexPerformance:
-    """Test performance characteristics of staleness detection."""
+    """Test performance characteristics of staleness detection.
 
-    @pytest.mark.asyncio
-    async def test_staleness_check_is_fast(self, temp_dir):
+    Timed with pytest-benchmark (min-of-N with warmup) rather than a single
+    perf_counter sample, so thresholds are less noisy on CI. Under
+    ``pytest -n auto --dist loadgroup`` these stay together on one worker.
+    """
+
+    @pytest.fixture
+    def bench_loop(self, event_loop_policy):
+        """Provide a private event loop for driving async calls from sync benchmarks."""
+        loop = event_loop_policy.new_event_loop()
+        yield loop
+        loop.close()
+
+    @pytest.mark.xdist_group("perf-serial")
+    def test_staleness_check_is_fast(self, benchmark, bench_loop, make_storage):
         """Verify that staleness checking doesn't significantly slow down search."""
-        storage = StorageManager(
-            memory_dir=temp_dir,
-            shared_dir=str(Path(temp_dir) / "shared"),
-            enable_caching=False,
-            enable_efficiency=False,
-            enable_memory_management=False,
-        )
+        storage = make_storage()
+
+        # Create 10 slots (save_memory takes the instance lock, so concurrent saves are safe)
+        async def create_slots():
+            await asyncio.gather(*(storage.save_memory(f"slot-{i}", f"Content {i}") for i in range(10)))
 
-        # Create 10 slots
-        for i in range(10):
-            await storage.save_memory(f"slot-{i}", f"Content {i}")
+        bench_loop.run_until_complete(create_slots())
 
-        # Measure search time
-        import time
+        def force_reindex():
+            storage._search_initialized = False
 
-        start = time.perf_counter()
-        await storage.search_memory(SearchQuery(query="content"))
-        elapsed = time.perf_counter() - start
+        # Measure a first search, including the staleness check and index build
+        query = SearchQuery(query="content")
+        benchmark.pedantic(
+            lambda: bench_loop.run_until_complete(storage.search_memory(query)),
+            setup=force_reindex,
+            rounds=10,
+            iterations=1,
+        )
 
         # Should complete in under 1 second (generous threshold)
-        assert elapsed < 1.0, f"Search took {elapsed}s, should be < 1s"
+        if benchmark.stats is None:  # --benchmark-disable: ran once, nothing timed
+            return
+        assert benchmark.stats["mean"] < 1.0, f"Search took {benchmark.stats['mean']}s, should be < 1s"
 
-    @pytest.mark.asyncio
-    async def test_repeated_searches_are_fast(self, temp_dir):
+    @pytest.mark.xdist_group("perf-serial")
+    def test_repeated_searches_are_fast(self, benchmark, bench_loop, make_storage):
         """Verify that repeated searches don't re-index unnecessarily."""
-        storage = StorageManager(
-            memory_dir=temp_dir,
-            shared_dir=str(Path(temp_dir) / "shared"),
-            enable_caching=False,
-            enable_efficiency=False,
-            enable_memory_management=False,
-        )
+        storage = make_storage()
 
-        await storage.save_memory("test-slot", "Test content")
+        bench_loop.run_until_complete(storage.save_memory("test-slot", "Test content"))
 
         # First search (indexes)
-        await storage.search_memory(SearchQuery(query="test"))
+        query = SearchQuery(query="test")
+        bench_loop.run_until_complete(storage.search_memory(query))
 
         # Subsequent searches (should use existing index)
-        import time
-
-        start = time.perf_counter()
-        for _ in range(10):
-            await storage.search_memory(SearchQuery(query="test"))
-        elapsed = time.perf_counter() - start
-
-        # 10 searches should be very fast (< 0.5s total)
-        assert elapsed < 0.5, f"10 searches took {elapsed}s, should be < 0.5s"
-
+        benchmark.pedantic(
+            lambda: bench_loop.run_until_complete(storage.search_memory(query)),
+            rounds=10,
+            iterations=1,
+        )
 
-@pytest.fixture
-def temp_dir():
-    """Provide temporary directory for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield tmpdir
+        # Searches should be very fast (< 0.05s each, i.e. 10 searches < 0.5s)
+        if benchmark.stats is None:  # --benchmark-disable: ran once, nothing timed
+            return
+        assert benchmark.stats["mean"] < 0.05, f"Search took {benchmark.stats['mean']}s, should be < 0.05s"
@@ -16,7 +16,6 @@ from memcord.models import MemorySlot
 class TestStorageManagerContracts:
     """Test StorageManager core contracts."""
 
-    @pytest.mark.asyncio
     async def test_storage_initialization_contract(self, clean_storage_manager):
         """Test StorageManager initialization contract."""
         storage = clean_storage_manager
@@ -29,7 +28,6 @@ class TestStorageManagerContracts:
         assert storage.memory_dir.is_absolute()
         assert storage.shared_dir.is_absolute()
 
-    @pytest.mark.asyncio
     async def test_save_memory_contract(self, clean_storage_manager):
         """Test save_memory core contract."""
         from .conftest import assert_valid_memory_entry
@@ -43,7 +41,7 @@ class TestStorageManagerContracts:
         assert entry.content == "Initial content"
 
         # Contract: manual_save should REPLACE content (correct behavior)
-        _ = await storage.save_memory("new_slot", "Updated content")
+        await storage.save_memory("new_slot", "Updated content")
 
         # Read and verify content was replaced (not appended)
         slot = await storage.read_memory("new_slot")
@@ -51,7 +49,6 @@ class TestStorageManagerContracts:
         assert len(slot.entries) == 1  # Only latest entry (replaced)
         assert slot.entries[0].content == "Updated content"
 
-    @pytest.mark.asyncio
     async def test_read_memory_contract(self, clean_storage_manager):
         """Test read_memory core contract."""
         storage = clean_storage_manager
@@ -69,7 +66,6 @@ class TestStorageManagerContracts:
         assert loaded.slot_name == "existing"
         assert len(loaded.entries) == 1
 
-    @pytest.mark.asyncio
     async def test_delete_slot_contract(self, clean_storage_manager):
         """Test delete_slot core contract."""
         storage = clean_storage_manager
@@ -11,8 +11,11 @@ Coverage: 63% (focuses on public API and business logic)
 Tests validate real API behavior (e.g., save_memory replaces, add_summary_entry appends).
 """
 
+import asyncio
+import json
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import aiofiles
 import pytest
@@ -44,6 +47,18 @@ class TestStorageManagerCoreOperations:
         assert slot.slot_name == "test_slot"
         assert len(slot.entries) == 1
 
+    @pytest.mark.asyncio
+    async def test_save_memory_slot_returns_committed_slot(self, clean_storage_manager):
+        """Test save_memory_slot returns the saved slot with the new entry last."""
+        storage = clean_storage_manager
+
+        await storage.save_memory("slot_return", "First entry", entry_type="auto_summary")
+        slot = await storage.save_memory_slot("slot_return", "Second entry", entry_type="auto_summary")
+
+        assert slot.slot_name == "slot_return"
+        assert [entry.content for entry in slot.entries] == ["First entry", "Second entry"]
+        assert await storage.read_memory("slot_return") == slot
+
     @pytest.mark.asyncio
     async def test_save_memory_replace_behavior(self, clean_storage_manager):
         """Test that save_memory replaces content (documented behavior)."""
@@ -148,6 +163,36 @@ class TestStorageManagerCoreOperations:
         assert "is_current" in slot1_info
         assert slot1_info["entry_count"] == 1  # Only one entry (replace behavior)
 
+    async def test_list_memory_slots_reuses_metadata_until_file_changes(self, clean_storage_manager):
+        """Test that listing only reloads slots whose files changed since the last listing."""
+        storage = clean_storage_manager
+        await storage.save_memory("steady", "Unchanged content")
+        await storage.save_memory("busy", "First content")
+        await storage.list_memory_slots()
+
+        with patch.object(storage, "_load_slot", side_effect=AssertionError("unchanged slot reloaded")):
+            assert {slot["name"] for slot in await storage.list_memory_slots()} == {"steady", "busy"}
+
+        await storage.add_summary_entry("busy", "Longer original text for summary", "Summary")
+        await storage.delete_slot("steady")
+
+        slots = await storage.list_memory_slots()
+        assert [slot["name"] for slot in slots] == ["busy"]
+        assert slots[0]["entry_count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_list_slot_names(self, clean_storage_manager):
+        """Test listing slot names without loading slot contents."""
+        storage = clean_storage_manager
+        assert storage.list_slot_names() == set()
+
+        await storage.save_memory("names_a", "Content A")
+        await storage.save_memory("names_b", "Content B")
+        await storage.save_slot_config("names_a", await storage.load_slot_config("names_a"))
+
+        # Per-slot config files are not slots
+        assert storage.list_slot_names() == {"names_a", "names_b"}
+
     @pytest.mark.asyncio
     async def test_add_summary_entry_functionality(self, clean_storage_manager):
         """Test adding summary entries to slots."""
@@ -190,6 +235,30 @@ class TestStorageManagerCoreOperations:
         current = storage.get_current_slot()
         assert current == "active_slot"
 
+    @pytest.mark.asyncio
+    async def test_create_constructs_instances_concurrently(self, temp_storage_dir):
+        """Test that the async create() factory builds ready-to-use instances."""
+        instances = await asyncio.gather(
+            *(
+                StorageManager.create(
+                    memory_dir=temp_storage_dir,
+                    shared_dir=str(Path(temp_storage_dir) / "shared"),
+                    enable_caching=False,
+                    enable_efficiency=False,
+                    enable_memory_management=False,
+                )
+                for _ in range(3)
+            )
+        )
+
+        assert len({id(storage) for storage in instances}) == 3
+        assert all(isinstance(storage, StorageManager) for storage in instances)
+
+        await instances[0].save_memory("created_slot", "Saved through create()")
+        slot = await instances[1].read_memory("created_slot")
+        assert slot is not None
+        assert slot.entries[0].content == "Saved through create()"
+
 
 class TestStorageManagerFileOperations:
     """Test StorageManager file-level operations."""
@@ -232,6 +301,140 @@ class TestStorageManagerFileOperations:
         assert len(loaded_slot.entries) == 1
         assert loaded_slot.entries[0].content == "Test file content"
 
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+    async def test_slot_file_layout_matches_stdlib_json(self, clean_storage_manager, monkeypatch, use_orjson):
+        """Test that slot files keep the stdlib json layout whichever serializer wrote them."""
+        storage = clean_storage_manager
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr("memcord.storage.orjson", None)
+
+        await storage.save_memory("layout_slot", "Unicode stays readable: café 中文 🚀")
+
+        slot_path = await storage._get_slot_path("layout_slot")
+        text = slot_path.read_text(encoding="utf-8")
+        assert "café 中文 🚀" in text
+        assert text == json.dumps(json.loads(text), indent=2, ensure_ascii=False)
+
+    @pytest.mark.asyncio
+    async def test_batched_writes_defer_and_coalesce_file_writes(self, clean_storage_manager):
+        """Test that batched writes are readable immediately and hit disk on exit."""
+        storage = clean_storage_manager
+        slot_path = await storage._get_slot_path("batched_slot")
+
+        async with storage.batched_writes():
+            await storage.save_memory("batched_slot", "First version")
+            await storage.save_memory("batched_slot", "Second version")
+            await asyncio.gather(*(storage.save_memory(f"batched_{i}", f"Content {i}") for i in range(3)))
+
+            # Nothing is on disk yet, but reads see the buffered slot
+            assert not slot_path.exists()
+            slot = await storage.read_memory("batched_slot")
+            assert slot is not None
+            assert slot.entries[0].content == "Second version"
+
+        assert slot_path.exists()
+        assert "Second version" in slot_path.read_text(encoding="utf-8")
+        assert {"batched_0", "batched_1", "batched_2"} <= {info["name"] for info in await storage.list_memory_slots()}
+        assert storage._pending_writes is None
+
+    @pytest.mark.asyncio
+    async def test_batched_writes_discarded_when_block_raises(self, temp_storage_dir):
+        """Test that an exception inside the batch leaves slot files, caches and search as they were."""
+        storage = StorageManager(
+            memory_dir=temp_storage_dir,
+            shared_dir=str(Path(temp_storage_dir) / "shared"),
+            enable_caching=True,
+            enable_efficiency=False,
+            enable_memory_management=False,
+        )
+        try:
+            await storage.save_memory("kept_slot", "Original content")
+            new_path = await storage._get_slot_path("never_written")
+
+            with pytest.raises(RuntimeError, match="abort batch"):
+                async with storage.batched_writes():
+                    await storage.save_memory("kept_slot", "Discarded update")
+                    await storage.save_memory("never_written", "Discarded slot")
+                    raise RuntimeError("abort batch")
+
+            assert storage._pending_writes is None
+            assert not new_path.exists()
+            assert await storage.read_memory("never_written") is None
+            slot = await storage.read_memory("kept_slot")
+            assert slot.entries[0].content == "Original content"
+            assert await storage.search_memory(SearchQuery(query="Discarded")) == []
+        finally:
+            await storage.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_batched_writes_failed_write_keeps_other_files(self, clean_storage_manager, monkeypatch):
+        """Test that one failed write in the flush still writes and snapshots the others."""
+        storage = clean_storage_manager
+        write_slot_file = StorageManager._write_slot_file
+
+        async def failing_write(slot_path, payload):
+            if slot_path.stem == "broken_slot":
+                raise OSError("disk full")
+            await write_slot_file(slot_path, payload)
+
+        monkeypatch.setattr(storage, "_write_slot_file", failing_write)
+        with pytest.raises(OSError, match="disk full"):
+            async with storage.batched_writes():
+                await storage.save_memory("broken_slot", "Lost")
+                await storage.save_memory("good_slot", "Written")
+
+        good_path = await storage._get_slot_path("good_slot")
+        assert good_path.exists()
+        assert storage._index_mtime_snapshot["good_slot"] == good_path.stat().st_mtime
+        assert "broken_slot" not in storage._index_mtime_snapshot
+
+    @pytest.mark.asyncio
+    async def test_batched_writes_listing_and_delete(self, clean_storage_manager):
+        """Test that buffered slots are listed and deletes inside a batch stick after the flush."""
+        storage = clean_storage_manager
+        await storage.save_memory("existing_slot", "Already on disk")
+
+        async with storage.batched_writes():
+            await storage.save_memory("buffered_slot", "Only buffered")
+            assert "buffered_slot" in storage.list_slot_names()
+            assert "buffered_slot" in {info["name"] for info in await storage.list_memory_slots()}
+
+            # Save then delete a slot that never reached disk
+            assert await storage.delete_slot("buffered_slot") is True
+
+            # Save then delete a slot whose older version is on disk
+            await storage.save_memory("existing_slot", "Buffered update")
+            assert await storage.delete_slot("existing_slot") is True
+
+            assert storage.list_slot_names() == set()
+
+        assert storage.list_slot_names() == set()
+        assert await storage.read_memory("buffered_slot") is None
+        assert await storage.read_memory("existing_slot") is None
+
+    @pytest.mark.asyncio
+    async def test_read_after_write_served_from_cache(self, temp_storage_dir):
+        """Test that reading a just-saved slot does not go back to disk."""
+        storage = StorageManager(
+            memory_dir=temp_storage_dir,
+            shared_dir=str(Path(temp_storage_dir) / "shared"),
+            enable_caching=True,
+            enable_efficiency=False,
+            enable_memory_management=False,
+        )
+        try:
+            await storage.save_memory("cached_slot", "Cached content")
+
+            with patch("memcord.storage.aiofiles.open", side_effect=AssertionError("slot re-read from disk")):
+                slot = await storage.read_memory("cached_slot")
+
+            assert slot is not None
+            assert slot.entries[0].content == "Cached content"
+        finally:
+            await storage.shutdown()
+
 
 class TestStorageManagerErrorHandling:
     """Test StorageManager error handling and edge cases."""
@@ -480,6 +683,28 @@ class TestStorageManagerSearchAPI:
         results = await storage.search_memory(query)
         assert isinstance(results, list)
 
+    async def test_search_memory_tag_and_group_filters_select_slots(self, clean_storage_manager):
+        """Test that active tag and group filters narrow search results to matching slots."""
+        storage = clean_storage_manager
+
+        await storage.save_memory("alpha_slot", "Shared searchable content")
+        await storage.save_memory("beta_slot", "Shared searchable content")
+        await storage.save_memory("gamma_slot", "Shared searchable content")
+        await storage.add_tag_to_slot("alpha_slot", "keep")
+        await storage.add_tag_to_slot("beta_slot", "keep")
+        await storage.add_tag_to_slot("beta_slot", "drop")
+        await storage.set_slot_group("alpha_slot", "projects/api")
+        await storage.set_slot_group("gamma_slot", "archive/old")
+
+        async def matching_slots(**filters) -> set[str]:
+            results = await storage.search_memory(SearchQuery(query="searchable", **filters))
+            return {r.slot_name for r in results}
+
+        assert await matching_slots(include_tags=["KEEP"]) == {"alpha_slot", "beta_slot"}
+        assert await matching_slots(include_tags=["keep"], exclude_tags=["drop"]) == {"alpha_slot"}
+        assert await matching_slots(include_groups=["projects"]) == {"alpha_slot", "beta_slot"}  # beta is ungrouped
+        assert await matching_slots(exclude_groups=["archive"]) == {"alpha_slot", "beta_slot"}
+
 
 class TestStorageManagerTagAPI:
     """Test tag management public API."""
@@ -574,6 +799,21 @@ class TestStorageManagerGroupAPI:
         updated_groups = await storage.list_groups()
         assert isinstance(updated_groups, list)
 
+    @pytest.mark.asyncio
+    async def test_list_groups_counts_members_from_listing(self, clean_storage_manager):
+        """Test list_groups member counts track group changes between listings."""
+        storage = clean_storage_manager
+        for name in ("a", "b", "c"):
+            await storage.create_or_get_slot(name)
+            await storage.set_slot_group(name, "team")
+
+        counts = {group.path: group.member_count for group in await storage.list_groups()}
+        assert counts["team"] == 3
+
+        await storage.set_slot_group("c", "other")
+        counts = {group.path: group.member_count for group in await storage.list_groups()}
+        assert counts == {"team": 2, "other": 1}
+
 
 class TestStorageManagerUtilityAPI:
     """Test utility and management public API methods."""